@@ -6,156 +6,269 @@ Fixed Date Handling to Prevent Timezone Issues
 Updated with Progressive Tax Brackets
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, g, render_template, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 import sqlite3
+import queue
+import functools
+import itertools
+import bisect
+import contextlib
+from dataclasses import dataclass
 from datetime import datetime, date
+from decimal import Decimal
+from types import MappingProxyType
+import os
 import webbrowser
+import socket
 import threading
 import time
 
+try:
+    import orjson
+except ImportError:  # optional - fall back to Flask's stdlib encoder
+    orjson = None
+
+try:
+    import waitress
+except ImportError:  # optional - fall back to Flask's threaded dev server
+    waitress = None
+
 app = Flask(__name__)
 
 # Database setup
 DATABASE = 'business_finance.db'
 
+# Worker threads for the WSGI server. The connection pool is sized to match
+# so a request never waits for a connection. Under gunicorn use a single
+# worker process with threads, e.g.:
+#   gunicorn -w 1 -k gthread --threads 8 app:app
+SERVER_THREADS = 8
+
+# Bind date objects straight to their ISO text form instead of relying on
+# sqlite3's default date adapter (deprecated as of Python 3.12)
+sqlite3.register_adapter(date, date.isoformat)
+# No connection registers Python callbacks; make sure a stray one can't start
+# printing tracebacks from inside SQLite
+sqlite3.enable_callback_tracebacks(False)
+
 def parse_date_safely(date_str):
     """Parse date string to date object to avoid timezone issues"""
     if not date_str:
         return None
     
-    # Handle HTML date input format (YYYY-MM-DD)
-    try:
-        # Parse as date object directly to avoid timezone conversion
-        parsed_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-        return parsed_date
-    except ValueError:
+    # Fast path for the HTML date input format (YYYY-MM-DD); fromisoformat
+    # is implemented in C and much cheaper than strptime
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    # Fall back to strptime for unpadded ISO dates and MM/DD/YYYY
+    for fmt in ('%Y-%m-%d', '%m/%d/%Y'):
         try:
-            # Try MM/DD/YYYY format as fallback
-            parsed_date = datetime.strptime(date_str, '%m/%d/%Y').date()
-            return parsed_date
+            return datetime.strptime(date_str, fmt).date()
         except ValueError:
-            return None
+            continue
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_str):
+    """parse_date_safely() memoized - forms resubmit the same few date strings"""
+    return parse_date_safely(date_str)
+
+def _round_half_up(value):
+    """Round to the nearest integer, halves away from zero (not banker's rounding)"""
+    return int(value + (0.5 if value >= 0 else -0.5))
+
+def cents(amount):
+    """Convert a dollar amount to whole cents"""
+    return _round_half_up(amount * 100)
+
+def to_dollars(amount_cents):
+    """Convert whole cents back to dollars at the JSON boundary"""
+    return amount_cents / 100
 
 # Progressive Tax Bracket Calculations
-def get_tax_brackets(tax_year, filing_status):
-    """Get tax brackets for the specified year and filing status"""
-    
-    # 2024 Tax Brackets
-    brackets_2024 = {
-        'single': [
-            (11600, 0.10),    # 10% on income up to $11,600
-            (47150, 0.12),    # 12% on income $11,601 to $47,150
-            (100525, 0.22),   # 22% on income $47,151 to $100,525
-            (191650, 0.24),   # 24% on income $100,526 to $191,650
-            (243725, 0.32),   # 32% on income $191,651 to $243,725
-            (609350, 0.35),   # 35% on income $243,726 to $609,350
-            (float('inf'), 0.37)  # 37% on income over $609,350
-        ],
-        'married-joint': [
-            (23200, 0.10),    # 10% on income up to $23,200
-            (94300, 0.12),    # 12% on income $23,201 to $94,300
-            (201050, 0.22),   # 22% on income $94,301 to $201,050
-            (383900, 0.24),   # 24% on income $201,051 to $383,900
-            (487450, 0.32),   # 32% on income $383,901 to $487,450
-            (731200, 0.35),   # 35% on income $487,451 to $731,200
-            (float('inf'), 0.37)  # 37% on income over $731,200
-        ],
-        'married-separate': [
-            (11600, 0.10),    # 10% on income up to $11,600
-            (47150, 0.12),    # 12% on income $11,601 to $47,150
-            (100525, 0.22),   # 22% on income $47,151 to $100,525
-            (191950, 0.24),   # 24% on income $100,526 to $191,950
-            (243725, 0.32),   # 32% on income $191,951 to $243,725
-            (365600, 0.35),   # 35% on income $243,726 to $365,600
-            (float('inf'), 0.37)  # 37% on income over $365,600
-        ],
-        'head-of-household': [
-            (16550, 0.10),    # 10% on income up to $16,550
-            (63100, 0.12),    # 12% on income $16,551 to $63,100
-            (100500, 0.22),   # 22% on income $63,101 to $100,500
-            (191650, 0.24),   # 24% on income $100,501 to $191,650
-            (243700, 0.32),   # 32% on income $191,651 to $243,700
-            (609350, 0.35),   # 35% on income $243,701 to $609,350
-            (float('inf'), 0.37)  # 37% on income over $609,350
-        ]
-    }
-    
-    # 2025 Tax Brackets (projected - adjust as needed when official rates are released)
-    brackets_2025 = {
-        'single': [
-            (12000, 0.10),    # Estimated adjustments for inflation
-            (48750, 0.12),
-            (103900, 0.22),
-            (198050, 0.24),
-            (252050, 0.32),
-            (630050, 0.35),
-            (float('inf'), 0.37)
-        ],
-        'married-joint': [
-            (24000, 0.10),
-            (97500, 0.12),
-            (207800, 0.22),
-            (396100, 0.24),
-            (504100, 0.32),
-            (756100, 0.35),
-            (float('inf'), 0.37)
-        ],
-        'married-separate': [
-            (12000, 0.10),
-            (48750, 0.12),
-            (103900, 0.22),
-            (198050, 0.24),
-            (252050, 0.32),
-            (378050, 0.35),
-            (float('inf'), 0.37)
-        ],
-        'head-of-household': [
-            (17100, 0.10),
-            (65250, 0.12),
-            (103900, 0.22),
-            (198050, 0.24),
-            (252050, 0.32),
-            (630050, 0.35),
-            (float('inf'), 0.37)
-        ]
-    }
+# Tax tables are built once at import; the getters below are plain lookups
+
+# 2024 Tax Brackets
+_BRACKETS_2024 = {
+    'single': (
+        (11600, 0.10),    # 10% on income up to $11,600
+        (47150, 0.12),    # 12% on income $11,601 to $47,150
+        (100525, 0.22),   # 22% on income $47,151 to $100,525
+        (191650, 0.24),   # 24% on income $100,526 to $191,650
+        (243725, 0.32),   # 32% on income $191,651 to $243,725
+        (609350, 0.35),   # 35% on income $243,726 to $609,350
+        (float('inf'), 0.37)  # 37% on income over $609,350
+    ),
+    'married-joint': (
+        (23200, 0.10),    # 10% on income up to $23,200
+        (94300, 0.12),    # 12% on income $23,201 to $94,300
+        (201050, 0.22),   # 22% on income $94,301 to $201,050
+        (383900, 0.24),   # 24% on income $201,051 to $383,900
+        (487450, 0.32),   # 32% on income $383,901 to $487,450
+        (731200, 0.35),   # 35% on income $487,451 to $731,200
+        (float('inf'), 0.37)  # 37% on income over $731,200
+    ),
+    'married-separate': (
+        (11600, 0.10),    # 10% on income up to $11,600
+        (47150, 0.12),    # 12% on income $11,601 to $47,150
+        (100525, 0.22),   # 22% on income $47,151 to $100,525
+        (191950, 0.24),   # 24% on income $100,526 to $191,950
+        (243725, 0.32),   # 32% on income $191,951 to $243,725
+        (365600, 0.35),   # 35% on income $243,726 to $365,600
+        (float('inf'), 0.37)  # 37% on income over $365,600
+    ),
+    'head-of-household': (
+        (16550, 0.10),    # 10% on income up to $16,550
+        (63100, 0.12),    # 12% on income $16,551 to $63,100
+        (100500, 0.22),   # 22% on income $63,101 to $100,500
+        (191650, 0.24),   # 24% on income $100,501 to $191,650
+        (243700, 0.32),   # 32% on income $191,651 to $243,700
+        (609350, 0.35),   # 35% on income $243,701 to $609,350
+        (float('inf'), 0.37)  # 37% on income over $609,350
+    )
+}
+
+# 2025 Tax Brackets (projected - adjust as needed when official rates are released)
+_BRACKETS_2025 = {
+    'single': (
+        (12000, 0.10),    # Estimated adjustments for inflation
+        (48750, 0.12),
+        (103900, 0.22),
+        (198050, 0.24),
+        (252050, 0.32),
+        (630050, 0.35),
+        (float('inf'), 0.37)
+    ),
+    'married-joint': (
+        (24000, 0.10),
+        (97500, 0.12),
+        (207800, 0.22),
+        (396100, 0.24),
+        (504100, 0.32),
+        (756100, 0.35),
+        (float('inf'), 0.37)
+    ),
+    'married-separate': (
+        (12000, 0.10),
+        (48750, 0.12),
+        (103900, 0.22),
+        (198050, 0.24),
+        (252050, 0.32),
+        (378050, 0.35),
+        (float('inf'), 0.37)
+    ),
+    'head-of-household': (
+        (17100, 0.10),
+        (65250, 0.12),
+        (103900, 0.22),
+        (198050, 0.24),
+        (252050, 0.32),
+        (630050, 0.35),
+        (float('inf'), 0.37)
+    )
+}
+
+# Other years default to the 2024 brackets
+_BRACKETS = {2024: _BRACKETS_2024, 2025: _BRACKETS_2025}
+
+# 2024 Standard Deductions
+_DEDUCTIONS_2024 = {
+    'single': 14600,
+    'married-joint': 29200,
+    'married-separate': 14600,
+    'head-of-household': 21900
+}
+
+# 2025 Standard Deductions (projected)
+_DEDUCTIONS_2025 = {
+    'single': 15100,
+    'married-joint': 30200,
+    'married-separate': 15100,
+    'head-of-household': 22700
+}
+
+_DEDUCTIONS = {2024: _DEDUCTIONS_2024, 2025: _DEDUCTIONS_2025}
+
+@dataclass(frozen=True, slots=True)
+class TaxYearConfig:
+    """Per-year figures used by the SE tax, mileage and Medicare calculations"""
+    ss_wage_base: int             # Social Security cap on SE income
+    mileage_rate_cents: int       # IRS standard mileage rate, cents per mile
+    medicare_thresholds: MappingProxyType  # Additional Medicare tax threshold by filing status
     
-    if tax_year == 2024:
-        return brackets_2024.get(filing_status, brackets_2024['single'])
-    elif tax_year == 2025:
-        return brackets_2025.get(filing_status, brackets_2025['single'])
-    else:
-        # Default to 2024 brackets for other years
-        return brackets_2024.get(filing_status, brackets_2024['single'])
+    def __post_init__(self):
+        # Keep a read-only copy so the shared per-year config can't be
+        # changed through the mapping it was built from or handed out
+        object.__setattr__(self, 'medicare_thresholds',
+                           MappingProxyType(dict(self.medicare_thresholds)))
+
+# Additional Medicare tax thresholds (not indexed for inflation)
+_MEDICARE_THRESHOLDS = {
+    'single': 200000,
+    'married-joint': 250000,
+    'married-separate': 125000,
+    'head-of-household': 200000
+}
+
+# Other years default to the 2024 figures
+_CONFIG = {
+    2024: TaxYearConfig(160200, 67, _MEDICARE_THRESHOLDS),
+    2025: TaxYearConfig(176100, 70, _MEDICARE_THRESHOLDS),
+}
+
+def get_tax_year_config(tax_year):
+    """Get the TaxYearConfig for the specified year"""
+    return _CONFIG.get(tax_year, _CONFIG[2024])
+
+def _build_bands(brackets):
+    """Precompute a bracket table for closed-form tax evaluation
+
+    Returns (limits, lowers, rates, cum_tax, bands): cum_tax[i] is the tax
+    owed on all income below lowers[i], and bands holds (width, rate, label,
+    range) per bracket for the detail breakdown.
+    """
+    limits, lowers, rates, cum_tax, bands = [], [], [], [], []
+    previous_limit = 0
+    running_tax = 0
+    for limit, rate in brackets:
+        span = f'${previous_limit:,.0f} - ${limit:,.0f}' if limit != float('inf') else f'${previous_limit:,.0f}+'
+        limits.append(limit)
+        lowers.append(previous_limit)
+        rates.append(rate)
+        cum_tax.append(running_tax)
+        bands.append((limit - previous_limit, rate, f'{rate*100:.0f}% bracket', span))
+        running_tax += (limit - previous_limit) * rate
+        previous_limit = limit
+    return tuple(limits), tuple(lowers), tuple(rates), tuple(cum_tax), tuple(bands)
+
+# Bracket limits, cumulative tax and display strings, so calculate_income_tax
+# is a binary search plus one multiply, with no per-call string formatting
+_BANDS = {
+    year: {status: _build_bands(brackets) for status, brackets in table.items()}
+    for year, table in _BRACKETS.items()
+}
+
+def get_tax_bands(tax_year, filing_status):
+    """Get the precomputed bracket table for a year and filing status"""
+    bands = _BANDS.get(tax_year, _BANDS[2024])
+    return bands.get(filing_status, bands['single'])
 
 def get_standard_deduction(tax_year, filing_status):
     """Get standard deduction for the specified year and filing status"""
-    
-    # 2024 Standard Deductions
-    deductions_2024 = {
-        'single': 14600,
-        'married-joint': 29200,
-        'married-separate': 14600,
-        'head-of-household': 21900
-    }
-    
-    # 2025 Standard Deductions (projected)
-    deductions_2025 = {
-        'single': 15100,
-        'married-joint': 30200,
-        'married-separate': 15100,
-        'head-of-household': 22700
-    }
-    
-    if tax_year == 2024:
-        return deductions_2024.get(filing_status, deductions_2024['single'])
-    elif tax_year == 2025:
-        return deductions_2025.get(filing_status, deductions_2025['single'])
-    else:
-        return deductions_2024.get(filing_status, deductions_2024['single'])
+    deductions = _DEDUCTIONS.get(tax_year, _DEDUCTIONS_2024)
+    return deductions.get(filing_status, deductions['single'])
+
+def calculate_income_tax(total_income, tax_year, filing_status, details=True):
+    """Calculate income tax using progressive brackets
 
-def calculate_income_tax(total_income, tax_year, filing_status):
-    """Calculate income tax using progressive brackets"""
+    The per-bracket breakdown is only built when `details` is true;
+    otherwise an empty list is returned alongside the total.
+    """
     if total_income <= 0:
         return 0, []
     
@@ -168,54 +281,41 @@ def calculate_income_tax(total_income, tax_year, filing_status):
     if taxable_income <= 0:
         return 0, [{'bracket': 'Standard Deduction', 'income': total_income, 'rate': 0, 'tax': 0}]
     
-    # Get tax brackets
-    brackets = get_tax_brackets(tax_year, filing_status)
+    limits, lowers, rates, cum_tax, bands = get_tax_bands(tax_year, filing_status)
     
-    total_tax = 0
-    remaining_income = taxable_income
-    bracket_details = []
-    previous_limit = 0
+    # Top bracket reached, then tax on everything below it plus the remainder
+    top = bisect.bisect_left(limits, taxable_income)
+    total_tax = cum_tax[top] + (taxable_income - lowers[top]) * rates[top]
     
-    for limit, rate in brackets:
-        if remaining_income <= 0:
-            break
-            
-        # Calculate income in this bracket
-        bracket_income = min(remaining_income, limit - previous_limit)
-        bracket_tax = bracket_income * rate
-        
-        total_tax += bracket_tax
-        remaining_income -= bracket_income
-        
+    bracket_details = []
+    if details:
         # Store bracket details for transparency
-        bracket_details.append({
-            'bracket': f'{rate*100:.0f}% bracket',
-            'income': bracket_income,
-            'rate': rate,
-            'tax': bracket_tax,
-            'range': f'${previous_limit:,.0f} - ${limit:,.0f}' if limit != float('inf') else f'${previous_limit:,.0f}+'
-        })
-        
-        previous_limit = limit
-        
-        if remaining_income <= 0:
-            break
+        for index in range(top + 1):
+            width, rate, label, span = bands[index]
+            bracket_income = width if index < top else taxable_income - lowers[top]
+            bracket_details.append({
+                'bracket': label,
+                'income': bracket_income,
+                'rate': rate,
+                'tax': bracket_income * rate,
+                'range': span
+            })
     
-    return round(total_tax, 2), bracket_details
+    return to_dollars(cents(total_tax)), bracket_details
 
-def calculate_self_employment_tax(net_profit):
+def calculate_self_employment_tax(net_profit, tax_year=2024):
     """Calculate self-employment tax (15.3% on 92.35% of net profit)"""
     if net_profit <= 0:
         return 0
     
-    # 2024 SE tax cap: $160,200 for Social Security portion (12.4%)
+    # The Social Security portion (12.4%) is capped at the year's wage base
     # Medicare portion (2.9%) has no cap
     # Additional Medicare tax (0.9%) applies to income over certain thresholds
     
     se_income = net_profit * 0.9235
     
     # Social Security tax (12.4% up to wage base)
-    ss_wage_base = 160200  # 2024 limit
+    ss_wage_base = get_tax_year_config(tax_year).ss_wage_base
     ss_taxable = min(se_income, ss_wage_base)
     ss_tax = ss_taxable * 0.124
     
@@ -224,168 +324,914 @@ def calculate_self_employment_tax(net_profit):
     
     total_se_tax = ss_tax + medicare_tax
     
-    return round(total_se_tax, 2)
+    return to_dollars(cents(total_se_tax))
+
+def calculate_mileage_deduction(miles, tax_year=2024):
+    """Calculate the standard mileage deduction, rounded to the cent"""
+    rate_cents = get_tax_year_config(tax_year).mileage_rate_cents
+    return to_dollars(_round_half_up(miles * rate_cents))
 
-def calculate_additional_medicare_tax(total_income, filing_status):
+def calculate_utility_deduction(monthly_amount, business_percentage):
+    """Calculate the (monthly, annual) deduction for the business share of a utility"""
+    # dollars * (percent / 100) is the same number as cents = dollars * percent,
+    # so round once in whole cents and scale back at the end
+    monthly_cents = _round_half_up(monthly_amount * business_percentage)
+    return to_dollars(monthly_cents), to_dollars(monthly_cents * 12)
+
+def calculate_additional_medicare_tax(total_income, filing_status, tax_year=2024):
     """Calculate additional Medicare tax (0.9% on income over threshold)"""
-    
-    # Additional Medicare tax thresholds
-    thresholds = {
-        'single': 200000,
-        'married-joint': 250000,
-        'married-separate': 125000,
-        'head-of-household': 200000
-    }
-    
+    thresholds = get_tax_year_config(tax_year).medicare_thresholds
     threshold = thresholds.get(filing_status, 200000)
     
     if total_income > threshold:
         additional_tax = (total_income - threshold) * 0.009
-        return round(additional_tax, 2)
+        return to_dollars(cents(additional_tax))
     
     return 0
 
+# Stored in PRAGMA user_version; bump it whenever the schema in init_db changes
+SCHEMA_VERSION = 3
+
+# Tables holding exactly one row (id = 1), written with an UPSERT
+SINGLETON_TABLES = (
+    # table, columns to keep, column ordering the newest row first
+    ('home_office', 'method, square_feet, home_square_feet, business_percentage, annual_deduction, created_at',
+     'created_at'),
+    ('tax_settings', 'business_name, tax_year, filing_status, other_income, prior_year_tax, created_at, updated_at',
+     'updated_at'),
+)
+
+def _stash_legacy_singletons(cursor):
+    """Rename pre-v3 singleton tables out of the way before they are recreated
+
+    Older databases kept one row per save (DELETE + INSERT) with an
+    autoincrement id; those tables are renamed to <table>_legacy and the
+    newest row is copied over by _restore_legacy_singletons().
+    """
+    stashed = []
+    for table, _, _ in SINGLETON_TABLES:
+        row = cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if row and 'CHECK (id = 1)' not in row[0]:
+            cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+            stashed.append(table)
+    return stashed
+
+def _restore_legacy_singletons(cursor, stashed):
+    """Copy the newest legacy row into each recreated singleton table"""
+    for table, columns, newest in SINGLETON_TABLES:
+        if table in stashed:
+            cursor.execute(f'''
+                INSERT INTO {table} (id, {columns})
+                SELECT 1, {columns} FROM {table}_legacy ORDER BY {newest} DESC LIMIT 1
+            ''')
+            cursor.execute(f'DROP TABLE {table}_legacy')
+
 def init_db():
     """Initialize the database with required tables"""
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    
-    # Income table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS income (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            client TEXT NOT NULL,
-            service_type TEXT NOT NULL,
-            amount REAL NOT NULL,
-            date DATE NOT NULL,
-            expects_1099 BOOLEAN NOT NULL,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Expenses table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS expenses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT NOT NULL,
-            description TEXT NOT NULL,
-            amount REAL NOT NULL,
-            date DATE NOT NULL,
-            business_purpose TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Mileage table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS mileage (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            start_location TEXT NOT NULL,
-            destination TEXT NOT NULL,
-            miles REAL NOT NULL,
-            business_purpose TEXT NOT NULL,
-            date DATE NOT NULL,
-            deduction_amount REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Home office table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS home_office (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            method TEXT NOT NULL,
-            square_feet INTEGER,
-            home_square_feet INTEGER,
-            business_percentage REAL,
-            annual_deduction REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Utilities table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS utilities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            utility_type TEXT NOT NULL,
-            monthly_amount REAL NOT NULL,
-            business_percentage REAL NOT NULL,
-            monthly_deduction REAL NOT NULL,
-            annual_deduction REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Tax payments table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tax_payments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            quarter TEXT NOT NULL,
-            amount REAL NOT NULL,
-            payment_date DATE NOT NULL,
-            payment_method TEXT,
-            confirmation_number TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Tax settings table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tax_settings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            business_name TEXT,
-            tax_year INTEGER,
-            filing_status TEXT,
-            other_income REAL DEFAULT 0,
-            prior_year_tax REAL DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Savings goals table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS savings_goals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_name TEXT NOT NULL,
-            target_amount REAL NOT NULL,
-            current_amount REAL DEFAULT 0,
-            target_date DATE,
-            goal_type TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    with contextlib.closing(sqlite3.connect(DATABASE, isolation_level=None)) as conn:
+        cursor = conn.cursor()
+        
+        # WAL lets readers and a writer proceed concurrently; journal_mode is
+        # persisted in the database file, the rest are per-connection
+        journal_mode = cursor.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            # e.g. a filesystem without shared-memory support; everything still
+            # works, but readers and the writer will block each other
+            app.logger.warning('SQLite WAL mode unavailable, using %s journal', journal_mode)
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA busy_timeout=30000')
+        
+        # Warm start - the schema is already current, nothing to create
+        if cursor.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
+        # Create everything in one transaction (one fsync instead of one per table);
+        # a failure part way rolls it all back and the connection is still closed
+        with transaction(conn):
+            stashed = _stash_legacy_singletons(cursor)
+            
+            # Income table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS income (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    client TEXT NOT NULL,
+                    service_type TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    date DATE NOT NULL,
+                    expects_1099 BOOLEAN NOT NULL,
+                    notes TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Expenses table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS expenses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    category TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    date DATE NOT NULL,
+                    business_purpose TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Mileage table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS mileage (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    start_location TEXT NOT NULL,
+                    destination TEXT NOT NULL,
+                    miles REAL NOT NULL,
+                    business_purpose TEXT NOT NULL,
+                    date DATE NOT NULL,
+                    deduction_amount REAL NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Home office table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS home_office (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    method TEXT NOT NULL,
+                    square_feet INTEGER,
+                    home_square_feet INTEGER,
+                    business_percentage REAL,
+                    annual_deduction REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Utilities table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS utilities (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    utility_type TEXT NOT NULL,
+                    monthly_amount REAL NOT NULL,
+                    business_percentage REAL NOT NULL,
+                    monthly_deduction REAL NOT NULL,
+                    annual_deduction REAL NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Tax payments table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tax_payments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    quarter TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    payment_date DATE NOT NULL,
+                    payment_method TEXT,
+                    confirmation_number TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Tax settings table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tax_settings (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    business_name TEXT,
+                    tax_year INTEGER,
+                    filing_status TEXT,
+                    other_income REAL DEFAULT 0,
+                    prior_year_tax REAL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Savings goals table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS savings_goals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    goal_name TEXT NOT NULL,
+                    target_amount REAL NOT NULL,
+                    current_amount REAL DEFAULT 0,
+                    target_date DATE,
+                    goal_type TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Indexes backing the ORDER BY ... DESC [LIMIT 1] queries in the API,
+            # so SQLite walks the index instead of sorting the whole table
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_income_date ON income(date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_mileage_date ON mileage(date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tax_payments_pdate ON tax_payments(payment_date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_utilities_created ON utilities(created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_savings_goals_created ON savings_goals(created_at DESC)')
+            
+            _restore_legacy_singletons(cursor, stashed)
+            
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        
+        # Refresh planner statistics so the new indexes get used
+        cursor.execute('ANALYZE')
+
+# init_db() runs once per process: from the launcher, or lazily before the
+# first pooled connection when the app is imported by a WSGI server
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+def ensure_db():
+    """Create or migrate the schema unless this process already has"""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            init_db()
+            _schema_ready = True
 
-def get_db_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(DATABASE)
+def _make_conn(readonly=False):
+    """Open a connection for the pool, configured for concurrent access"""
+    # A read-only open fails outright if the database file doesn't exist yet
+    ensure_db()
+    # isolation_level=None leaves transaction control to transaction() below.
+    # Read-only handles are opened with mode=ro so they can never take the
+    # write lock; under WAL they read a snapshot without blocking the writer.
+    target = f'file:{DATABASE}?mode=ro' if readonly else DATABASE
+    conn = sqlite3.connect(target, uri=readonly, check_same_thread=False,
+                           cached_statements=256, isolation_level=None)
     conn.row_factory = sqlite3.Row
+    # journal_mode=WAL is persisted in the database file by init_db(); the
+    # remaining pragmas are per-connection and must be set on every one
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA busy_timeout=30000')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA foreign_keys=ON')
     return conn
 
+def commit_with_retry(conn, retries=5, delay=0.05):
+    """Commit, backing off exponentially while the database is locked"""
+    for attempt in range(retries):
+        try:
+            conn.commit()
+            return
+        except sqlite3.OperationalError as e:
+            if 'database is locked' not in str(e) or attempt == retries - 1:
+                raise
+            time.sleep(delay * (2 ** attempt))
+
+# Bumped after every committed write. Together with a per-process id it
+# gives responses derived only from the database a cheap validator.
+_BOOT_ID = format(time.time_ns(), 'x')
+_version_counter = itertools.count(1)
+_data_version = 0
+
+def _bump_data_version():
+    """Record that the database changed"""
+    global _data_version
+    _data_version = next(_version_counter)
+
+def data_etag():
+    """ETag for responses that depend only on stored data and today's date"""
+    return f'{_BOOT_ID}-{_data_version}-{date.today().toordinal()}'
+
+@contextlib.contextmanager
+def transaction(conn, caches=()):
+    """Run the enclosed writes as one BEGIN IMMEDIATE ... COMMIT block
+
+    Taking the write lock up front means a busy database is waited on
+    (busy_timeout) before any work is done, rather than failing at commit.
+    `caches` are the single-row caches the writes touch; they are dropped
+    before the data version moves, so a response rebuilt for the new
+    version can never be filled from a stale cached row.
+    """
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    commit_with_retry(conn)
+    for cache in caches:
+        _invalidate_cache(cache)
+    _bump_data_version()
+
+# Connection pools - one writer plus one read-only handle per server thread.
+# SQLite serializes writers anyway, so write requests queue here instead of
+# spinning on busy_timeout. Each slot starts empty (None) and is connected
+# on first use, so importing the module doesn't touch the database file.
+POOL_SIZE = SERVER_THREADS
+WRITER_POOL_SIZE = 1
+
+def _make_pool(size):
+    """Build a pool of empty slots that connect lazily"""
+    pool = queue.Queue(maxsize=size)
+    for _ in range(size):
+        pool.put(None)
+    return pool
+
+_POOL = _make_pool(WRITER_POOL_SIZE)
+_RO_POOL = _make_pool(POOL_SIZE)
+
+def get_db(readonly=None):
+    """Get the current request's database connection, borrowing one from a pool
+
+    GET and HEAD requests get a read-only connection unless told otherwise.
+    """
+    if 'db' not in g:
+        if readonly is None:
+            readonly = request.method in ('GET', 'HEAD')
+        pool = _RO_POOL if readonly else _POOL
+        conn = pool.get()
+        if conn is None:
+            try:
+                conn = _make_conn(readonly)
+            except Exception:
+                pool.put(None)
+                raise
+        g.db = conn
+        g.db_pool = pool
+    return g.db
+
+def release_db_connection(conn, pool=_POOL):
+    """Hand a borrowed connection back to the pool it came from"""
+    try:
+        if conn.in_transaction:
+            # Don't hand a half-finished transaction to the next request
+            conn.rollback()
+    except sqlite3.Error:
+        # A broken connection is dropped; its slot reconnects on next use
+        conn.close()
+        conn = None
+    pool.put(conn)
+
+@app.teardown_appcontext
+def close_db(exc):
+    """Return the request's connection to the pool, even if the handler raised"""
+    conn = g.pop('db', None)
+    pool = g.pop('db_pool', _POOL)
+    if conn is not None:
+        release_db_connection(conn, pool)
+
+# Background upkeep interval, per SQLite's advice to refresh planner
+# statistics periodically on long-lived databases
+MAINTENANCE_INTERVAL = 15 * 60
+# Rows sampled per index by the periodic ANALYZE, so it stays cheap on big tables
+ANALYSIS_LIMIT = 400
+
+def _maintenance_loop(interval=MAINTENANCE_INTERVAL):
+    """Refresh planner statistics and truncate the WAL every interval seconds
+
+    Runs on its own connection so a checkpoint never ties up a pooled one.
+    PRAGMA optimize would be a no-op here: before SQLite 3.46 it only
+    analyzes tables the running connection has queried, and this one is
+    fresh. So a bounded ANALYZE is run instead; on 3.46+ the equivalent
+    would be PRAGMA optimize=0x10002.
+    """
+    while True:
+        time.sleep(interval)
+        try:
+            with contextlib.closing(sqlite3.connect(DATABASE, isolation_level=None)) as conn:
+                conn.execute('PRAGMA busy_timeout=30000')
+                conn.execute(f'PRAGMA analysis_limit={ANALYSIS_LIMIT}')
+                conn.execute('ANALYZE')
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.Error:
+            app.logger.exception('Database maintenance failed')
+
+# In-process caches for the single-row tables read on every dashboard load.
+# Readers fill them under the lock so a write that commits and invalidates
+# mid-read can't leave a stale row marked valid.
+_TAX_SETTINGS_CACHE = {'row': None, 'valid': False}
+_HOME_OFFICE_CACHE = {'row': None, 'valid': False}
+_cache_lock = threading.Lock()
+
+def _get_cached_row(cache, conn, sql):
+    """Return a cached single-row query result as a dict (or None)"""
+    if cache['valid']:
+        return cache['row']
+    with _cache_lock:
+        if not cache['valid']:
+            row = conn.execute(sql).fetchone()
+            cache['row'] = dict(row) if row else None
+            cache['valid'] = True
+        return cache['row']
+
+def _invalidate_cache(cache):
+    """Drop a cached row after its table has been written"""
+    with _cache_lock:
+        cache['valid'] = False
+
+def _get_tax_settings(conn):
+    """Get the current tax settings row (cached)"""
+    return _get_cached_row(_TAX_SETTINGS_CACHE, conn, SQL_SELECT_TAX_SETTINGS)
+
+def _get_home_office(conn):
+    """Get the current home office row (cached)"""
+    return _get_cached_row(_HOME_OFFICE_CACHE, conn, SQL_SELECT_HOME_OFFICE)
+
+def _orjson_default(obj):
+    """Serialize the types the app emits that orjson doesn't handle itself
+
+    Anything else raises TypeError, as Flask's default provider does, so an
+    unexpected value surfaces as an error instead of its repr.
+    """
+    if isinstance(obj, sqlite3.Row):
+        return dict(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Route jsonify() and request.get_json() through orjson's C codec"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default).decode()
+    
+    def loads(self, s, **kwargs):
+        # orjson.JSONDecodeError subclasses ValueError, so get_json(silent=True)
+        # still turns a malformed body into None
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default), mimetype=self.mimetype
+        )
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+def _plain_rows(cursor):
+    """Switch a cursor to plain tuples and return its column names
+
+    Serializers only need column order, so this skips wrapping every fetched
+    row in a sqlite3.Row first.
+    """
+    cursor.row_factory = None
+    return [column[0] for column in cursor.description]
+
+def _json_response(cursor):
+    """Build a JSON response for a query's rows, encoded by orjson in C when available"""
+    columns = _plain_rows(cursor)
+    records = cursor.fetchall()
+    
+    # ?format=columns sends the column names once plus one array per row,
+    # a smaller payload that skips building a dict for every row
+    if request.args.get('format') == 'columns':
+        payload = {'columns': columns, 'rows': records}
+    else:
+        payload = [dict(zip(columns, record)) for record in records]
+    
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+def _stream_json_response(cursor):
+    """Stream a query's rows as a JSON array, encoding one row at a time
+
+    Rows are pulled straight from the cursor instead of fetchall(), so memory
+    stays flat on large tables and the first bytes go out before the query
+    finishes. stream_with_context keeps the request's pooled connection
+    checked out until the last row has been sent.
+    """
+    if request.args.get('format') == 'columns':
+        return _json_response(cursor)
+    
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: app.json.dumps(obj).encode()
+    
+    columns = _plain_rows(cursor)
+    
+    def generate():
+        separator = b'['
+        for record in cursor:
+            yield separator + dumps(dict(zip(columns, record)))
+            separator = b','
+        yield b']' if separator == b',' else b'[]'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+# Marks a schema field that has no default and must be supplied
+_REQUIRED = object()
+
+def _text(value):
+    """Coerce a required text field, rejecting null"""
+    if value is None:
+        raise ValueError
+    return str(value)
+
+def _optional_text(value):
+    """Coerce an optional text field; null becomes an empty string"""
+    return '' if value is None else str(value)
+
+def _flag(value):
+    """Coerce a checkbox-style field to SQLite's 0/1"""
+    return 1 if value else 0
+
+def _date(value):
+    """Coerce a required date field"""
+    parsed = parse_date_safely(value)
+    if not parsed:
+        raise ValueError
+    return parsed
+
+def _optional_date(value):
+    """Coerce an optional date field; empty values mean no date"""
+    if not value:
+        return None
+    parsed = _parse_date_cached(value)
+    if not parsed:
+        raise ValueError
+    return parsed
+
+# Payload schemas as (field, coerce, default), each in the column order of
+# its INSERT statement so the coerced tuple binds directly
+INCOME_SCHEMA = (
+    ('client', _text, _REQUIRED),
+    ('service_type', _text, _REQUIRED),
+    ('amount', float, _REQUIRED),
+    ('date', _date, _REQUIRED),
+    ('expects_1099', _flag, _REQUIRED),
+    ('notes', _optional_text, ''),
+)
+EXPENSE_SCHEMA = (
+    ('category', _text, _REQUIRED),
+    ('description', _text, _REQUIRED),
+    ('amount', float, _REQUIRED),
+    ('date', _date, _REQUIRED),
+    ('business_purpose', _text, _REQUIRED),
+)
+# Followed by the computed deduction_amount (see _mileage_params)
+MILEAGE_SCHEMA = (
+    ('start_location', _text, _REQUIRED),
+    ('destination', _text, _REQUIRED),
+    ('miles', float, _REQUIRED),
+    ('business_purpose', _text, _REQUIRED),
+    ('date', _date, _REQUIRED),
+)
+# Followed by the computed monthly/annual deductions (see _utility_params)
+UTILITY_SCHEMA = (
+    ('utility_type', _text, _REQUIRED),
+    ('monthly_amount', float, _REQUIRED),
+    ('business_percentage', float, _REQUIRED),
+)
+# The method picks which measurements are required (see _home_office_params)
+HOME_OFFICE_SCHEMA = (
+    ('method', _text, _REQUIRED),
+)
+HOME_OFFICE_SIMPLIFIED_SCHEMA = (
+    ('square_feet', int, _REQUIRED),
+)
+HOME_OFFICE_ACTUAL_SCHEMA = (
+    ('home_square_feet', int, _REQUIRED),
+    ('office_square_feet', int, _REQUIRED),
+)
+TAX_SETTINGS_SCHEMA = (
+    ('business_name', _text, _REQUIRED),
+    ('tax_year', int, _REQUIRED),
+    ('filing_status', _text, _REQUIRED),
+    ('other_income', float, 0),
+    ('prior_year_tax', float, 0),
+)
+TAX_PAYMENT_SCHEMA = (
+    ('quarter', _text, _REQUIRED),
+    ('amount', float, _REQUIRED),
+    ('payment_date', _date, _REQUIRED),
+    ('payment_method', _optional_text, ''),
+    ('confirmation_number', _optional_text, ''),
+)
+# Query parameters for /api/simulate
+SIMULATE_SCHEMA = (
+    ('net_profit', float, _REQUIRED),
+    ('start', float, 0.0),
+    ('steps', int, 50),
+    ('tax_year', int, 2024),
+    ('filing_status', _text, 'single'),
+)
+SAVINGS_GOAL_SCHEMA = (
+    ('goal_name', _text, _REQUIRED),
+    ('target_amount', float, _REQUIRED),
+    ('current_amount', float, 0),
+    ('target_date', _optional_date, None),
+    ('goal_type', _text, 'general'),
+)
+
+class PayloadError(ValueError):
+    """A request payload failed validation; the message is sent to the client"""
+
+def _coerce_value(coerce, value, field):
+    """Coerce a single payload value, raising PayloadError naming `field`"""
+    try:
+        return coerce(value)
+    except (TypeError, ValueError):
+        raise PayloadError(f'Invalid value for field: {field}') from None
+
+def _record_id(value, field):
+    """Accept only a JSON integer as a row id, raising PayloadError otherwise
+
+    Unlike int(), this never truncates 2.7 or turns true into 1, so a
+    malformed id can't land on some other row.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise PayloadError(f'Invalid value for field: {field}')
+
+def _coerce(data, schema):
+    """Validate and coerce a JSON object against a schema in one pass
+
+    Returns the values in schema order, or raises PayloadError naming the
+    first missing or invalid field.
+    """
+    if not isinstance(data, dict):
+        raise PayloadError('Invalid JSON payload')
+    values = []
+    for field, coerce, default in schema:
+        if field not in data:
+            if default is _REQUIRED:
+                raise PayloadError(f'Missing required field: {field}')
+            values.append(default)
+            continue
+        values.append(_coerce_value(coerce, data[field], field))
+    return tuple(values)
+
+def _coerce_payload(data, schema):
+    """_coerce() for handlers: returns (values, None) or (None, a 400 response)"""
+    try:
+        return _coerce(data, schema), None
+    except PayloadError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+
+def _coerced_rows(items, schema, build=None):
+    """Lazily coerce a list of payloads into parameter tuples for executemany
+
+    Rows are produced as SQLite consumes them, with no intermediate list.
+    A bad item raises PayloadError mid-batch, which rolls back the enclosing
+    transaction() and is answered with a 400 by the api decorator.
+    """
+    for item in items:
+        values = _coerce(item, schema)
+        yield build(values) if build else values
+
+def _mileage_params(trip):
+    """Append the IRS mileage deduction to a coerced mileage payload
+
+    The rate is the one in effect for the year the trip was made.
+    """
+    miles, trip_date = trip[2], trip[4]
+    return trip + (calculate_mileage_deduction(miles, trip_date.year),)
+
+def _home_office_params(data):
+    """Build the home office row for either deduction method
+
+    Both methods bind the same (method, square_feet, home_square_feet,
+    business_percentage, annual_deduction) columns, with None for the
+    measurements the simplified method doesn't use.
+    """
+    method, = _coerce(data, HOME_OFFICE_SCHEMA)
+    if method == 'simplified':
+        square_feet, = _coerce(data, HOME_OFFICE_SIMPLIFIED_SCHEMA)
+        annual_deduction = min(square_feet * 5, 1500)  # $5 per sq ft, max $1500
+        return ('simplified', square_feet, None, None, annual_deduction)
+    
+    # actual method
+    home_sq_ft, office_sq_ft = _coerce(data, HOME_OFFICE_ACTUAL_SCHEMA)
+    if home_sq_ft <= 0:
+        raise PayloadError('Invalid value for field: home_square_feet')
+    business_percentage = round((office_sq_ft / home_sq_ft) * 100, 2)
+    return ('actual', office_sq_ft, home_sq_ft, business_percentage, 0)
+
+def _utility_params(utility):
+    """Append the monthly and annual deductions to a coerced utility payload"""
+    _, monthly_amount, business_percentage = utility
+    return utility + calculate_utility_deduction(monthly_amount, business_percentage)
+
+def _delete_ids(conn, sql):
+    """Delete the records listed in a {"ids": [...]} body with one statement
+
+    The ids are bound as a single JSON array and expanded by json_each(), so
+    the statement text is the same for any number of ids and stays cached.
+    """
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not ids:
+        return jsonify({'error': 'Expected a non-empty list of ids'}), 400
+    
+    ids = [_record_id(record_id, 'ids') for record_id in ids]
+    with transaction(conn):
+        cursor = conn.execute(sql, (app.json.dumps(ids),))
+    
+    return jsonify({'success': True, 'deleted': cursor.rowcount})
+
+def api(fn):
+    """Map an API endpoint's expected failures to JSON error responses
+
+    Payload validation raises PayloadError, which is a client error and gets
+    a 400; database errors get a logged 500. Anything else, including a
+    stray TypeError or ValueError, is a bug and is left to Flask, which logs
+    it and answers via handle_server_error.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except PayloadError as e:
+            return jsonify({'error': str(e)}), 400
+        except sqlite3.Error as e:
+            app.logger.exception('Database error in %s', fn.__name__)
+            return jsonify({'error': str(e)}), 500
+    return wrapper
+
+def conditional(fn):
+    """Serve a GET endpoint's data-derived response with an ETag
+
+    The tag is data_etag(), so a client revalidating (Cache-Control:
+    no-cache) gets a bodiless 304 until something is written, and the view
+    doesn't run at all. Other methods and non-200 responses pass through.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return fn(*args, **kwargs)
+        # Read the tag before the data, so a concurrent write can only make
+        # the body newer than its tag, never older
+        etag = data_etag()
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.make_response(fn(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return wrapper
+
+@app.errorhandler(500)
+def handle_server_error(e):
+    """Keep unexpected API failures in JSON so the frontend can report them"""
+    if request.path.startswith('/api/'):
+        return jsonify({'error': 'Internal server error'}), 500
+    return e
+
+# SQL statements, kept as module constants so each pooled connection's
+# statement cache reuses the prepared statement across requests
+SQL_INSERT_INCOME = '''
+    INSERT INTO income (client, service_type, amount, date, expects_1099, notes)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_INCOME = '''
+    UPDATE income
+    SET client = ?, service_type = ?, amount = ?, date = ?, expects_1099 = ?, notes = ?
+    WHERE id = ?
+'''
+SQL_SELECT_INCOME_ALL = 'SELECT * FROM income ORDER BY date DESC'
+SQL_SELECT_INCOME = 'SELECT * FROM income WHERE id = ?'
+SQL_DELETE_INCOME = 'DELETE FROM income WHERE id = ?'
+
+SQL_INSERT_EXPENSE = '''
+    INSERT INTO expenses (category, description, amount, date, business_purpose)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_EXPENSE = '''
+    UPDATE expenses
+    SET category = ?, description = ?, amount = ?, date = ?, business_purpose = ?
+    WHERE id = ?
+'''
+SQL_SELECT_EXPENSES_ALL = 'SELECT * FROM expenses ORDER BY date DESC'
+SQL_SELECT_EXPENSE = 'SELECT * FROM expenses WHERE id = ?'
+SQL_DELETE_EXPENSE = 'DELETE FROM expenses WHERE id = ?'
+
+SQL_INSERT_MILEAGE = '''
+    INSERT INTO mileage (start_location, destination, miles, business_purpose, date, deduction_amount)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_MILEAGE = '''
+    UPDATE mileage
+    SET start_location = ?, destination = ?, miles = ?, business_purpose = ?, date = ?, deduction_amount = ?
+    WHERE id = ?
+'''
+SQL_SELECT_MILEAGE_ALL = 'SELECT * FROM mileage ORDER BY date DESC'
+SQL_SELECT_MILEAGE = 'SELECT * FROM mileage WHERE id = ?'
+SQL_DELETE_MILEAGE = 'DELETE FROM mileage WHERE id = ?'
+
+SQL_INSERT_UTILITY = '''
+    INSERT INTO utilities (utility_type, monthly_amount, business_percentage, monthly_deduction, annual_deduction)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_UTILITY = '''
+    UPDATE utilities
+    SET utility_type = ?, monthly_amount = ?, business_percentage = ?,
+        monthly_deduction = ?, annual_deduction = ?
+    WHERE id = ?
+'''
+SQL_SELECT_UTILITIES_ALL = 'SELECT * FROM utilities ORDER BY created_at DESC'
+SQL_SELECT_UTILITY = 'SELECT * FROM utilities WHERE id = ?'
+SQL_DELETE_UTILITY = 'DELETE FROM utilities WHERE id = ?'
+SQL_DELETE_UTILITIES = 'DELETE FROM utilities WHERE id IN (SELECT value FROM json_each(?))'
+
+# The home office and tax settings tables hold a single row with id = 1
+SQL_UPSERT_HOME_OFFICE = '''
+    INSERT INTO home_office (id, method, square_feet, home_square_feet, business_percentage, annual_deduction)
+    VALUES (1, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        method = excluded.method,
+        square_feet = excluded.square_feet,
+        home_square_feet = excluded.home_square_feet,
+        business_percentage = excluded.business_percentage,
+        annual_deduction = excluded.annual_deduction,
+        created_at = CURRENT_TIMESTAMP
+'''
+SQL_UPSERT_TAX_SETTINGS = '''
+    INSERT INTO tax_settings (id, business_name, tax_year, filing_status, other_income, prior_year_tax)
+    VALUES (1, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        business_name = excluded.business_name,
+        tax_year = excluded.tax_year,
+        filing_status = excluded.filing_status,
+        other_income = excluded.other_income,
+        prior_year_tax = excluded.prior_year_tax,
+        updated_at = CURRENT_TIMESTAMP
+'''
+SQL_SELECT_HOME_OFFICE = 'SELECT * FROM home_office WHERE id = 1'
+SQL_SELECT_TAX_SETTINGS = 'SELECT * FROM tax_settings WHERE id = 1'
+
+SQL_INSERT_TAX_PAYMENT = '''
+    INSERT INTO tax_payments (quarter, amount, payment_date, payment_method, confirmation_number)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_TAX_PAYMENT = '''
+    UPDATE tax_payments
+    SET quarter = ?, amount = ?, payment_date = ?, payment_method = ?, confirmation_number = ?
+    WHERE id = ?
+'''
+SQL_SELECT_TAX_PAYMENTS_ALL = 'SELECT * FROM tax_payments ORDER BY payment_date DESC'
+SQL_SELECT_TAX_PAYMENT = 'SELECT * FROM tax_payments WHERE id = ?'
+SQL_DELETE_TAX_PAYMENT = 'DELETE FROM tax_payments WHERE id = ?'
+SQL_DELETE_TAX_PAYMENTS = 'DELETE FROM tax_payments WHERE id IN (SELECT value FROM json_each(?))'
+
+SQL_INSERT_SAVINGS_GOAL = '''
+    INSERT INTO savings_goals (goal_name, target_amount, current_amount, target_date, goal_type)
+    VALUES (?, ?, ?, ?, ?)
+'''
+# Single-row create that hands back the new id in the same statement
+# (SQLite 3.35+); executemany can't consume RETURNING rows, so bulk inserts
+# keep the plain form above
+SQL_INSERT_SAVINGS_GOAL_RETURNING = SQL_INSERT_SAVINGS_GOAL.rstrip() + ' RETURNING id, created_at'
+SQL_UPDATE_SAVINGS_GOAL = '''
+    UPDATE savings_goals
+    SET goal_name = ?, target_amount = ?, current_amount = ?, target_date = ?, goal_type = ?
+    WHERE id = ?
+'''
+SQL_SELECT_SAVINGS_GOALS_ALL = 'SELECT * FROM savings_goals ORDER BY created_at DESC'
+SQL_SELECT_SAVINGS_GOAL = 'SELECT * FROM savings_goals WHERE id = ?'
+SQL_DELETE_SAVINGS_GOAL = 'DELETE FROM savings_goals WHERE id = ?'
+SQL_DELETE_SAVINGS_GOALS = 'DELETE FROM savings_goals WHERE id IN (SELECT value FROM json_each(?))'
+
+@functools.lru_cache(maxsize=32)
+def _savings_goal_patch_sql(fields):
+    """Build the UPDATE for one set of patched columns
+
+    Cached per field set (always in SAVINGS_GOAL_SCHEMA order), so repeated
+    same-shape patches pass the identical string and hit the connection's
+    prepared statement cache.
+    """
+    assignments = ', '.join(f'{field} = ?' for field in fields)
+    return f'UPDATE savings_goals SET {assignments} WHERE id = ?'
+
+@functools.lru_cache(maxsize=4)
 def get_quarterly_due_dates(tax_year):
     """Get quarterly tax due dates for a given tax year"""
-    return [
-        f"{tax_year}-04-15",  # Q1
-        f"{tax_year}-06-15",  # Q2  
-        f"{tax_year}-09-15",  # Q3
-        f"{tax_year + 1}-01-15"  # Q4
-    ]
+    return (
+        date(tax_year, 4, 15),     # Q1
+        date(tax_year, 6, 15),     # Q2
+        date(tax_year, 9, 15),     # Q3
+        date(tax_year + 1, 1, 15)  # Q4
+    )
 
 def get_tax_reminders():
     """Get tax payment reminders (30 days before due)"""
-    today = date.today()
+    return _reminders_for(date.today().toordinal())
+
+@functools.lru_cache(maxsize=4)
+def _reminders_for(today_ordinal):
+    """Build the reminders for one day; the cache key rolls over at midnight"""
+    today = date.fromordinal(today_ordinal)
     current_year = today.year
     
     # Get current tax year due dates
     due_dates = get_quarterly_due_dates(current_year)
     
     reminders = []
-    for i, due_date in enumerate(due_dates, 1):
-        due = datetime.strptime(due_date, "%Y-%m-%d").date()
+    for i, due in enumerate(due_dates, 1):
         days_until_due = (due - today).days
         
         status = "future"
@@ -396,12 +1242,13 @@ def get_tax_reminders():
         
         reminders.append({
             'quarter': f'Q{i}',
-            'due_date': due_date,
+            'due_date': due.isoformat(),
             'days_until_due': days_until_due,
             'status': status
         })
     
-    return reminders
+    # Shared between requests, so hand out an immutable sequence
+    return tuple(reminders)
 
 # Routes
 @app.route('/')
@@ -409,861 +1256,772 @@ def index():
     """Main dashboard"""
     return render_template('index.html')
 
+# Last rendered overview body as (etag, bytes)
+_OVERVIEW_CACHE = {'entry': None}
+
 @app.route('/api/overview')
+@api
+@conditional
 def api_overview():
-    """API endpoint for overview data"""
-    try:
-        conn = get_db_connection()
-        
-        # Get totals
-        income_result = conn.execute('SELECT SUM(amount) as total FROM income').fetchone()
-        expenses_result = conn.execute('SELECT SUM(amount) as total FROM expenses').fetchone()
-        mileage_result = conn.execute('SELECT SUM(deduction_amount) as total FROM mileage').fetchone()
-        
-        total_income = income_result['total'] or 0
-        total_expenses = expenses_result['total'] or 0
-        mileage_deductions = mileage_result['total'] or 0
-        
-        # Calculate home office deduction
-        home_office = conn.execute('SELECT annual_deduction FROM home_office ORDER BY created_at DESC LIMIT 1').fetchone()
-        home_office_deduction = home_office['annual_deduction'] if home_office else 0
-        
-        # Calculate utility deductions
-        utilities_result = conn.execute('SELECT SUM(annual_deduction) as total FROM utilities').fetchone()
-        utility_deductions = utilities_result['total'] or 0
-        
-        # Calculate net profit
-        total_deductions = total_expenses + mileage_deductions + home_office_deduction + utility_deductions
-        net_profit = total_income - total_deductions
-        
-        # Calculate taxes using progressive brackets
-        se_tax = calculate_self_employment_tax(net_profit)
-        
-        # Get tax settings for income tax calculation
-        tax_settings = conn.execute('SELECT * FROM tax_settings ORDER BY updated_at DESC LIMIT 1').fetchone()
-        
-        income_tax = 0
-        bracket_details = []
-        additional_medicare_tax = 0
-        
-        if tax_settings and net_profit > 0:
-            # Calculate total income for tax purposes
-            other_income = tax_settings['other_income'] or 0
-            total_income_for_tax = net_profit + other_income
-            
-            # Calculate income tax with progressive brackets
-            income_tax, bracket_details = calculate_income_tax(
-                total_income_for_tax, 
-                tax_settings['tax_year'], 
-                tax_settings['filing_status']
-            )
-            
-            # Calculate additional Medicare tax if applicable
-            additional_medicare_tax = calculate_additional_medicare_tax(
-                total_income_for_tax, 
-                tax_settings['filing_status']
-            )
-        
-        total_tax = se_tax + income_tax + additional_medicare_tax
-        
-        # Get recent transactions
-        recent_income = conn.execute(
-            'SELECT client, amount, date, "income" as type FROM income ORDER BY date DESC LIMIT 5'
-        ).fetchall()
-        
-        recent_expenses = conn.execute(
-            'SELECT description, amount, date, "expense" as type FROM expenses ORDER BY date DESC LIMIT 5'
-        ).fetchall()
-        
-        # Combine and sort recent transactions
-        all_recent = []
-        for row in recent_income:
-            all_recent.append(dict(row))
-        for row in recent_expenses:
-            all_recent.append(dict(row))
-        
-        all_recent.sort(key=lambda x: x['date'], reverse=True)
-        recent_transactions = all_recent[:10]
-        
-        # Get tax reminders
-        tax_reminders = get_tax_reminders()
-        
-        conn.close()
-        
-        return jsonify({
-            'total_income': float(total_income),
-            'total_expenses': float(total_expenses),
-            'mileage_deductions': float(mileage_deductions),
-            'home_office_deduction': float(home_office_deduction),
-            'utility_deductions': float(utility_deductions),
-            'net_profit': float(net_profit),
-            'self_employment_tax': float(se_tax),
-            'income_tax': float(income_tax),
-            'additional_medicare_tax': float(additional_medicare_tax),
-            'total_tax': float(total_tax),
-            'bracket_details': bracket_details,
-            'recent_transactions': recent_transactions,
-            'tax_reminders': tax_reminders
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """API endpoint for overview data
+
+    The dashboard polls this, but the figures only change on a write (or
+    when the date rolls over for reminders), so besides the ETag an
+    unchanged body is reused.
+    """
+    etag = data_etag()
+    entry = _OVERVIEW_CACHE['entry']
+    if entry is None or entry[0] != etag:
+        entry = (etag, app.json.dumps(_build_overview(get_db())))
+        _OVERVIEW_CACHE['entry'] = entry
+    
+    return app.response_class(entry[1], mimetype='application/json')
+
+# Business totals and the derived deduction/net profit figures in one statement
+SQL_SELECT_TOTALS = '''
+    WITH t AS (
+        SELECT
+            (SELECT COALESCE(SUM(amount), 0) FROM income) AS total_income,
+            (SELECT COALESCE(SUM(amount), 0) FROM expenses) AS total_expenses,
+            (SELECT COALESCE(SUM(deduction_amount), 0) FROM mileage) AS mileage_deductions,
+            (SELECT COALESCE(SUM(annual_deduction), 0) FROM utilities) AS utility_deductions,
+            ? AS home_office_deduction
+    )
+    SELECT *,
+        total_expenses + mileage_deductions + home_office_deduction + utility_deductions AS total_deductions,
+        total_income - (total_expenses + mileage_deductions + home_office_deduction + utility_deductions) AS net_profit
+    FROM t
+'''
+
+SQL_SELECT_RECENT_TRANSACTIONS = '''
+    SELECT client, NULL AS description, amount, date, 'income' AS type FROM income
+    UNION ALL
+    SELECT NULL, description, amount, date, 'expense' FROM expenses
+    ORDER BY date DESC LIMIT 10
+'''
+
+def _fetch_totals(conn):
+    """Fetch income, deduction and net profit totals as a single row
+
+    The home office deduction comes from the cached single-row table and is
+    bound into the query so every figure is computed in one round-trip.
+    """
+    home_office = _get_home_office(conn)
+    home_office_deduction = home_office['annual_deduction'] if home_office else 0
+    return conn.execute(SQL_SELECT_TOTALS, (home_office_deduction,)).fetchone()
+
+def _build_overview(conn):
+    """Compute the dashboard totals, taxes, recent activity and reminders"""
+    totals = _fetch_totals(conn)
+    
+    total_income = totals['total_income']
+    total_expenses = totals['total_expenses']
+    mileage_deductions = totals['mileage_deductions']
+    utility_deductions = totals['utility_deductions']
+    home_office_deduction = totals['home_office_deduction']
+    net_profit = totals['net_profit']
+    
+    # Get tax settings for income tax calculation
+    tax_settings = _get_tax_settings(conn)
+    
+    # Calculate taxes using progressive brackets
+    se_tax = calculate_self_employment_tax(
+        net_profit, tax_settings['tax_year'] if tax_settings else 2024
+    )
+    
+    income_tax = 0
+    bracket_details = []
+    additional_medicare_tax = 0
+    
+    if tax_settings and net_profit > 0:
+        # Calculate total income for tax purposes
+        other_income = tax_settings['other_income'] or 0
+        total_income_for_tax = net_profit + other_income
+    
+        # Calculate income tax with progressive brackets
+        income_tax, bracket_details = calculate_income_tax(
+            total_income_for_tax, 
+            tax_settings['tax_year'], 
+            tax_settings['filing_status']
+        )
+    
+        # Calculate additional Medicare tax if applicable
+        additional_medicare_tax = calculate_additional_medicare_tax(
+            total_income_for_tax, 
+            tax_settings['filing_status'],
+            tax_settings['tax_year']
+        )
+    
+    # Add in whole cents so the total carries no float drift
+    total_tax = to_dollars(sum(map(cents, (se_tax, income_tax, additional_medicare_tax))))
+    
+    # Get the 10 most recent income/expense entries, merged by SQLite
+    recent_transactions = [dict(row) for row in conn.execute(SQL_SELECT_RECENT_TRANSACTIONS)]
+    
+    # Get tax reminders
+    tax_reminders = get_tax_reminders()
+    
+    # SQLite REAL sums and the tax helpers already yield plain numbers
+    return {
+        'total_income': total_income,
+        'total_expenses': total_expenses,
+        'mileage_deductions': mileage_deductions,
+        'home_office_deduction': home_office_deduction,
+        'utility_deductions': utility_deductions,
+        'net_profit': net_profit,
+        'self_employment_tax': se_tax,
+        'income_tax': income_tax,
+        'additional_medicare_tax': additional_medicare_tax,
+        'total_tax': total_tax,
+        'bracket_details': bracket_details,
+        'recent_transactions': recent_transactions,
+        'tax_reminders': tax_reminders
+    }
 
 # ===== INCOME ENDPOINTS =====
 @app.route('/api/income', methods=['GET', 'POST'])
+@api
 def api_income():
     """Handle income operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            income_date = parse_date_safely(data['date'])
-            if not income_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                INSERT INTO income (client, service_type, amount, date, expects_1099, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                data['client'],
-                data['service_type'],
-                data['amount'],
-                income_date,
-                data['expects_1099'],
-                data.get('notes', '')
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        else:
-            income_records = conn.execute(
-                'SELECT * FROM income ORDER BY date DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in income_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'POST':
+        income, error = _coerce_payload(request.get_json(silent=True), INCOME_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_INSERT_INCOME, income)
+    
+        return jsonify({'success': True})
+    
+    else:
+        return _json_response(conn.execute(SQL_SELECT_INCOME_ALL))
+
+@app.route('/api/income/bulk', methods=['POST'])
+@api
+def api_income_bulk():
+    """Insert a list of income records in a single transaction"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of income records'}), 400
+    
+    conn = get_db()
+    with transaction(conn):
+        cursor = conn.executemany(SQL_INSERT_INCOME, _coerced_rows(data, INCOME_SCHEMA))
+    
+    return jsonify({'success': True, 'inserted': cursor.rowcount})
 
 @app.route('/api/income/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@api
 def api_income_modify(record_id):
     """Handle income view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM income WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            income_date = parse_date_safely(data['date'])
-            if not income_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                UPDATE income 
-                SET client = ?, service_type = ?, amount = ?, date = ?, expects_1099 = ?, notes = ?
-                WHERE id = ?
-            ''', (
-                data['client'],
-                data['service_type'],
-                data['amount'],
-                income_date,
-                data['expects_1099'],
-                data.get('notes', ''),
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM income WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-# ===== EXPENSE ENDPOINTS =====
-@app.route('/api/expenses', methods=['GET', 'POST'])
-def api_expenses():
-    """Handle expense operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            expense_date = parse_date_safely(data['date'])
-            if not expense_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                INSERT INTO expenses (category, description, amount, date, business_purpose)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['category'],
-                data['description'],
-                data['amount'],
-                expense_date,
-                data['business_purpose']
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_INCOME, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
         else:
-            expense_records = conn.execute(
-                'SELECT * FROM expenses ORDER BY date DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in expense_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        income, error = _coerce_payload(request.get_json(silent=True), INCOME_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_INCOME, income + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_INCOME, (record_id,))
+    
+        return jsonify({'success': True})
+
+# ===== EXPENSE ENDPOINTS =====
+@app.route('/api/expenses', methods=['GET', 'POST'])
+@api
+def api_expenses():
+    """Handle expense operations"""
+    conn = get_db()
+    
+    if request.method == 'POST':
+        expense, error = _coerce_payload(request.get_json(silent=True), EXPENSE_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_INSERT_EXPENSE, expense)
+    
+        return jsonify({'success': True})
+    
+    else:
+        return _json_response(conn.execute(SQL_SELECT_EXPENSES_ALL))
+
+@app.route('/api/expenses/bulk', methods=['POST'])
+@api
+def api_expenses_bulk():
+    """Insert a list of expense records in a single transaction"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of expense records'}), 400
+    
+    conn = get_db()
+    with transaction(conn):
+        cursor = conn.executemany(SQL_INSERT_EXPENSE, _coerced_rows(data, EXPENSE_SCHEMA))
+    
+    return jsonify({'success': True, 'inserted': cursor.rowcount})
 
 @app.route('/api/expenses/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@api
 def api_expenses_modify(record_id):
     """Handle expense view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM expenses WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            expense_date = parse_date_safely(data['date'])
-            if not expense_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                UPDATE expenses 
-                SET category = ?, description = ?, amount = ?, date = ?, business_purpose = ?
-                WHERE id = ?
-            ''', (
-                data['category'],
-                data['description'],
-                data['amount'],
-                expense_date,
-                data['business_purpose'],
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM expenses WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_EXPENSE, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
+        else:
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        expense, error = _coerce_payload(request.get_json(silent=True), EXPENSE_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_EXPENSE, expense + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_EXPENSE, (record_id,))
+    
+        return jsonify({'success': True})
 
 # ===== MILEAGE ENDPOINTS =====
 @app.route('/api/mileage', methods=['GET', 'POST'])
+@api
 def api_mileage():
     """Handle mileage operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            mileage_date = parse_date_safely(data['date'])
-            if not mileage_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            # Calculate deduction (2024 IRS rate: $0.67 per mile)
-            miles = float(data['miles'])
-            deduction = round(miles * 0.67, 2)
-            
-            conn.execute('''
-                INSERT INTO mileage (start_location, destination, miles, business_purpose, date, deduction_amount)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                data['start_location'],
-                data['destination'],
-                data['miles'],
-                data['business_purpose'],
-                mileage_date,
-                deduction
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        else:
-            mileage_records = conn.execute(
-                'SELECT * FROM mileage ORDER BY date DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in mileage_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'POST':
+        trip, error = _coerce_payload(request.get_json(silent=True), MILEAGE_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_INSERT_MILEAGE, _mileage_params(trip))
+    
+        return jsonify({'success': True})
+    
+    else:
+        return _json_response(conn.execute(SQL_SELECT_MILEAGE_ALL))
+
+@app.route('/api/mileage/bulk', methods=['POST'])
+@api
+def api_mileage_bulk():
+    """Insert a list of mileage records in a single transaction"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of mileage records'}), 400
+    
+    conn = get_db()
+    with transaction(conn):
+        cursor = conn.executemany(SQL_INSERT_MILEAGE, _coerced_rows(data, MILEAGE_SCHEMA, _mileage_params))
+    
+    return jsonify({'success': True, 'inserted': cursor.rowcount})
 
 @app.route('/api/mileage/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@api
 def api_mileage_modify(record_id):
     """Handle mileage view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM mileage WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            mileage_date = parse_date_safely(data['date'])
-            if not mileage_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            # Recalculate deduction with updated miles
-            miles = float(data['miles'])
-            deduction = round(miles * 0.67, 2)
-            
-            conn.execute('''
-                UPDATE mileage 
-                SET start_location = ?, destination = ?, miles = ?, business_purpose = ?, date = ?, deduction_amount = ?
-                WHERE id = ?
-            ''', (
-                data['start_location'],
-                data['destination'],
-                data['miles'],
-                data['business_purpose'],
-                mileage_date,
-                deduction,
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM mileage WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_MILEAGE, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
+        else:
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        trip, error = _coerce_payload(request.get_json(silent=True), MILEAGE_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_MILEAGE, _mileage_params(trip) + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_MILEAGE, (record_id,))
+    
+        return jsonify({'success': True})
 
 # ===== UTILITY ENDPOINTS =====
-@app.route('/api/utilities', methods=['GET', 'POST'])
+@app.route('/api/utilities', methods=['GET', 'POST', 'DELETE'])
+@api
 def api_utilities():
-    """Handle utility expenses"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            monthly_amount = float(data['monthly_amount'])
-            business_percentage = float(data['business_percentage'])
-            monthly_deduction = round(monthly_amount * (business_percentage / 100), 2)
-            annual_deduction = monthly_deduction * 12
-            
-            conn.execute('''
-                INSERT INTO utilities (utility_type, monthly_amount, business_percentage, monthly_deduction, annual_deduction)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['utility_type'],
-                monthly_amount,
-                business_percentage,
-                monthly_deduction,
-                annual_deduction
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        else:
-            utility_records = conn.execute(
-                'SELECT * FROM utilities ORDER BY created_at DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in utility_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """Handle utility expenses; DELETE takes {"ids": [...]} to remove several at once"""
+    conn = get_db()
+    
+    if request.method == 'POST':
+        utility, error = _coerce_payload(request.get_json(silent=True), UTILITY_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_INSERT_UTILITY, _utility_params(utility))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        return _delete_ids(conn, SQL_DELETE_UTILITIES)
+    
+    else:
+        return _json_response(conn.execute(SQL_SELECT_UTILITIES_ALL))
+
+@app.route('/api/utilities/bulk', methods=['POST'])
+@api
+def api_utilities_bulk():
+    """Insert a list of utility expenses in a single transaction"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of utility records'}), 400
+    
+    conn = get_db()
+    with transaction(conn):
+        cursor = conn.executemany(SQL_INSERT_UTILITY, _coerced_rows(data, UTILITY_SCHEMA, _utility_params))
+    
+    return jsonify({'success': True, 'inserted': cursor.rowcount})
 
 @app.route('/api/utilities/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@api
 def api_utilities_modify(record_id):
     """Handle utility view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM utilities WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            monthly_amount = float(data['monthly_amount'])
-            business_percentage = float(data['business_percentage'])
-            monthly_deduction = round(monthly_amount * (business_percentage / 100), 2)
-            annual_deduction = monthly_deduction * 12
-            
-            conn.execute('''
-                UPDATE utilities 
-                SET utility_type = ?, monthly_amount = ?, business_percentage = ?, 
-                    monthly_deduction = ?, annual_deduction = ?
-                WHERE id = ?
-            ''', (
-                data['utility_type'],
-                monthly_amount,
-                business_percentage,
-                monthly_deduction,
-                annual_deduction,
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM utilities WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_UTILITY, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
+        else:
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        utility, error = _coerce_payload(request.get_json(silent=True), UTILITY_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_UTILITY, _utility_params(utility) + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_UTILITY, (record_id,))
+    
+        return jsonify({'success': True})
 
 # ===== HOME OFFICE ENDPOINTS =====
 @app.route('/api/home-office', methods=['GET', 'POST'])
+@api
+@conditional
 def api_home_office():
     """Handle home office deduction"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Clear existing home office setup
-            conn.execute('DELETE FROM home_office')
-            
-            if data['method'] == 'simplified':
-                square_feet = int(data['square_feet'])
-                annual_deduction = min(square_feet * 5, 1500)  # $5 per sq ft, max $1500
-                
-                conn.execute('''
-                    INSERT INTO home_office (method, square_feet, annual_deduction)
-                    VALUES (?, ?, ?)
-                ''', ('simplified', square_feet, annual_deduction))
-            
-            else:  # actual method
-                home_sq_ft = int(data['home_square_feet'])
-                office_sq_ft = int(data['office_square_feet'])
-                business_percentage = round((office_sq_ft / home_sq_ft) * 100, 2)
-                
-                conn.execute('''
-                    INSERT INTO home_office (method, square_feet, home_square_feet, business_percentage, annual_deduction)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', ('actual', office_sq_ft, home_sq_ft, business_percentage, 0))
-            
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
+    conn = get_db()
+    
+    if request.method == 'POST':
+        # A bad payload raises PayloadError, answered with a 400 by @api
+        params = _home_office_params(request.get_json(silent=True))
+    
+        # Overwrite the single home office row in place
+        with transaction(conn, caches=(_HOME_OFFICE_CACHE,)):
+            conn.execute(SQL_UPSERT_HOME_OFFICE, params)
+    
+        return jsonify({'success': True})
+    
+    else:
+        home_office = _get_home_office(conn)
+    
+        if home_office:
+            return jsonify(home_office)
         else:
-            home_office = conn.execute(
-                'SELECT * FROM home_office ORDER BY created_at DESC LIMIT 1'
-            ).fetchone()
-            
-            conn.close()
-            
-            if home_office:
-                return jsonify(dict(home_office))
-            else:
-                return jsonify({})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            return jsonify({})
 
 # ===== TAX SETTINGS ENDPOINTS =====
 @app.route('/api/tax-settings', methods=['GET', 'POST'])
+@api
+@conditional
 def api_tax_settings():
     """Handle tax settings"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Clear existing settings
-            conn.execute('DELETE FROM tax_settings')
-            
-            conn.execute('''
-                INSERT INTO tax_settings (business_name, tax_year, filing_status, other_income, prior_year_tax)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['business_name'],
-                data['tax_year'],
-                data['filing_status'],
-                data.get('other_income', 0),
-                data.get('prior_year_tax', 0)
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
+    conn = get_db()
+    
+    if request.method == 'POST':
+        settings, error = _coerce_payload(request.get_json(silent=True), TAX_SETTINGS_SCHEMA)
+        if error:
+            return error
+    
+        # Overwrite the single settings row in place
+        with transaction(conn, caches=(_TAX_SETTINGS_CACHE,)):
+            conn.execute(SQL_UPSERT_TAX_SETTINGS, settings)
+    
+        return jsonify({'success': True})
+    
+    else:
+        tax_settings = _get_tax_settings(conn)
+    
+        if tax_settings:
+            return jsonify(tax_settings)
         else:
-            tax_settings = conn.execute(
-                'SELECT * FROM tax_settings ORDER BY updated_at DESC LIMIT 1'
-            ).fetchone()
-            
-            conn.close()
-            
-            if tax_settings:
-                return jsonify(dict(tax_settings))
-            else:
-                return jsonify({})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            return jsonify({})
 
 # ===== TAX PAYMENT ENDPOINTS =====
-@app.route('/api/tax-payments', methods=['GET', 'POST'])
+@app.route('/api/tax-payments', methods=['GET', 'POST', 'DELETE'])
+@api
+@conditional
 def api_tax_payments():
-    """Handle tax payments"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            payment_date = parse_date_safely(data['payment_date'])
-            if not payment_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                INSERT INTO tax_payments (quarter, amount, payment_date, payment_method, confirmation_number)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['quarter'],
-                data['amount'],
-                payment_date,
-                data.get('payment_method', ''),
-                data.get('confirmation_number', '')
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        else:
-            payment_records = conn.execute(
-                'SELECT * FROM tax_payments ORDER BY payment_date DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in payment_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """Handle tax payments; DELETE takes {"ids": [...]} to remove several at once"""
+    conn = get_db()
+    
+    if request.method == 'POST':
+        payment, error = _coerce_payload(request.get_json(silent=True), TAX_PAYMENT_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_INSERT_TAX_PAYMENT, payment)
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        return _delete_ids(conn, SQL_DELETE_TAX_PAYMENTS)
+    
+    else:
+        return _stream_json_response(conn.execute(SQL_SELECT_TAX_PAYMENTS_ALL))
+
+@app.route('/api/tax-payments/bulk', methods=['POST'])
+@api
+def api_tax_payments_bulk():
+    """Insert a list of tax payments in a single transaction"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of tax payments'}), 400
+    
+    conn = get_db()
+    with transaction(conn):
+        cursor = conn.executemany(SQL_INSERT_TAX_PAYMENT, _coerced_rows(data, TAX_PAYMENT_SCHEMA))
+    
+    return jsonify({'success': True, 'inserted': cursor.rowcount})
 
 @app.route('/api/tax-payments/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@api
 def api_tax_payments_modify(record_id):
     """Handle tax payment view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM tax_payments WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            # Parse date safely to avoid timezone issues
-            payment_date = parse_date_safely(data['payment_date'])
-            if not payment_date:
-                return jsonify({'error': 'Invalid date format'}), 400
-            
-            conn.execute('''
-                UPDATE tax_payments 
-                SET quarter = ?, amount = ?, payment_date = ?, payment_method = ?, confirmation_number = ?
-                WHERE id = ?
-            ''', (
-                data['quarter'],
-                data['amount'],
-                payment_date,
-                data.get('payment_method', ''),
-                data.get('confirmation_number', ''),
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM tax_payments WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_TAX_PAYMENT, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
+        else:
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        payment, error = _coerce_payload(request.get_json(silent=True), TAX_PAYMENT_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_TAX_PAYMENT, payment + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_TAX_PAYMENT, (record_id,))
+    
+        return jsonify({'success': True})
 
 # ===== SAVINGS GOALS ENDPOINTS =====
-@app.route('/api/savings-goals', methods=['GET', 'POST'])
+@app.route('/api/savings-goals', methods=['GET', 'POST', 'DELETE'])
+@api
+@conditional
 def api_savings_goals():
-    """Handle savings goals"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'POST':
-            data = request.json
-            
-            # Parse target date safely (optional field)
-            target_date = None
-            if data.get('target_date'):
-                target_date = parse_date_safely(data['target_date'])
-                if not target_date:
-                    return jsonify({'error': 'Invalid target date format'}), 400
-            
-            conn.execute('''
-                INSERT INTO savings_goals (goal_name, target_amount, current_amount, target_date, goal_type)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                data['goal_name'],
-                data['target_amount'],
-                data.get('current_amount', 0),
-                target_date,
-                data.get('goal_type', 'general')
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
+    """Handle savings goals; DELETE takes {"ids": [...]} to remove several at once"""
+    conn = get_db()
+    
+    if request.method == 'POST':
+        goal, error = _coerce_payload(request.get_json(silent=True), SAVINGS_GOAL_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            # Read the RETURNING row before COMMIT finalizes the statement
+            created = conn.execute(SQL_INSERT_SAVINGS_GOAL_RETURNING, goal).fetchone()
+    
+        return jsonify({'success': True, 'id': created['id'], 'created_at': created['created_at']})
+    
+    elif request.method == 'DELETE':
+        return _delete_ids(conn, SQL_DELETE_SAVINGS_GOALS)
+    
+    else:
+        return _stream_json_response(conn.execute(SQL_SELECT_SAVINGS_GOALS_ALL))
+
+@app.route('/api/savings-goals/bulk', methods=['POST'])
+@api
+def api_savings_goals_bulk():
+    """Create or update a list of savings goals in a single transaction
+
+    Items carrying an 'id' update that goal; items without one are inserted.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'Expected a list of savings goals'}), 400
+    
+    inserts = []
+    updates = []
+    for item in data:
+        goal, error = _coerce_payload(item, SAVINGS_GOAL_SCHEMA)
+        if error:
+            return error
+        
+        if item.get('id') is not None:
+            updates.append(goal + (_record_id(item['id'], 'id'),))
         else:
-            goal_records = conn.execute(
-                'SELECT * FROM savings_goals ORDER BY created_at DESC'
-            ).fetchall()
-            
-            conn.close()
-            
-            return jsonify([dict(row) for row in goal_records])
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            inserts.append(goal)
+    
+    conn = get_db()
+    with transaction(conn):
+        inserted = conn.executemany(SQL_INSERT_SAVINGS_GOAL, inserts).rowcount if inserts else 0
+        # Ids that match no goal update nothing and aren't counted
+        updated = conn.executemany(SQL_UPDATE_SAVINGS_GOAL, updates).rowcount if updates else 0
+    
+    return jsonify({'success': True, 'inserted': inserted, 'updated': updated})
 
-@app.route('/api/savings-goals/<int:record_id>', methods=['GET', 'PUT', 'DELETE'])
+@app.route('/api/savings-goals/<int:record_id>', methods=['GET', 'PUT', 'PATCH', 'DELETE'])
+@api
 def api_savings_goals_modify(record_id):
     """Handle savings goal view/edit/delete operations"""
-    try:
-        conn = get_db_connection()
-        
-        if request.method == 'GET':
-            record = conn.execute(
-                'SELECT * FROM savings_goals WHERE id = ?', (record_id,)
-            ).fetchone()
-            conn.close()
-            
-            if record:
-                return jsonify(dict(record))
-            else:
-                return jsonify({'error': 'Record not found'}), 404
-        
-        elif request.method == 'PUT':
-            data = request.json
-            
-            # Parse target date safely (optional field)
-            target_date = None
-            if data.get('target_date'):
-                target_date = parse_date_safely(data['target_date'])
-                if not target_date:
-                    return jsonify({'error': 'Invalid target date format'}), 400
-            
-            conn.execute('''
-                UPDATE savings_goals 
-                SET goal_name = ?, target_amount = ?, current_amount = ?, target_date = ?, goal_type = ?
-                WHERE id = ?
-            ''', (
-                data['goal_name'],
-                data['target_amount'],
-                data.get('current_amount', 0),
-                target_date,
-                data.get('goal_type', 'general'),
-                record_id
-            ))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-        
-        elif request.method == 'DELETE':
-            conn.execute('DELETE FROM savings_goals WHERE id = ?', (record_id,))
-            conn.commit()
-            conn.close()
-            
-            return jsonify({'success': True})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    conn = get_db()
+    
+    if request.method == 'GET':
+        record = conn.execute(SQL_SELECT_SAVINGS_GOAL, (record_id,)).fetchone()
+    
+        if record:
+            return jsonify(dict(record))
+        else:
+            return jsonify({'error': 'Record not found'}), 404
+    
+    elif request.method == 'PUT':
+        goal, error = _coerce_payload(request.get_json(silent=True), SAVINGS_GOAL_SCHEMA)
+        if error:
+            return error
+    
+        with transaction(conn):
+            conn.execute(SQL_UPDATE_SAVINGS_GOAL, goal + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'PATCH':
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Expected a JSON object'}), 400
+    
+        # Only the columns present in the payload are coerced and written
+        schema = tuple(entry for entry in SAVINGS_GOAL_SCHEMA if entry[0] in data)
+        if not schema:
+            return jsonify({'error': 'No updatable fields supplied'}), 400
+        values, error = _coerce_payload(data, schema)
+        if error:
+            return error
+    
+        fields = tuple(entry[0] for entry in schema)
+        with transaction(conn):
+            conn.execute(_savings_goal_patch_sql(fields), values + (record_id,))
+    
+        return jsonify({'success': True})
+    
+    elif request.method == 'DELETE':
+        with transaction(conn):
+            conn.execute(SQL_DELETE_SAVINGS_GOAL, (record_id,))
+    
+        return jsonify({'success': True})
 
 # ===== NEW TAX BREAKDOWN ENDPOINT =====
+# Last rendered breakdown as (etag, bytes), bytes None without tax settings
+_BREAKDOWN_CACHE = {'entry': None}
+
 @app.route('/api/tax-breakdown')
+@api
+@conditional
 def api_tax_breakdown():
-    """API endpoint for detailed tax breakdown with progressive brackets"""
-    try:
-        conn = get_db_connection()
-        
-        # Get financial data
-        income_result = conn.execute('SELECT SUM(amount) as total FROM income').fetchone()
-        expenses_result = conn.execute('SELECT SUM(amount) as total FROM expenses').fetchone()
-        mileage_result = conn.execute('SELECT SUM(deduction_amount) as total FROM mileage').fetchone()
-        
-        total_income = income_result['total'] or 0
-        total_expenses = expenses_result['total'] or 0
-        mileage_deductions = mileage_result['total'] or 0
-        
-        # Calculate home office deduction
-        home_office = conn.execute('SELECT annual_deduction FROM home_office ORDER BY created_at DESC LIMIT 1').fetchone()
-        home_office_deduction = home_office['annual_deduction'] if home_office else 0
-        
-        # Calculate utility deductions
-        utilities_result = conn.execute('SELECT SUM(annual_deduction) as total FROM utilities').fetchone()
-        utility_deductions = utilities_result['total'] or 0
-        
-        # Calculate net profit
-        total_deductions = total_expenses + mileage_deductions + home_office_deduction + utility_deductions
-        net_profit = total_income - total_deductions
-        
-        # Get tax settings
-        tax_settings = conn.execute('SELECT * FROM tax_settings ORDER BY updated_at DESC LIMIT 1').fetchone()
-        
-        conn.close()
-        
-        if not tax_settings:
-            return jsonify({'error': 'Tax settings not configured'}), 400
-        
-        # Calculate taxes with detailed breakdown
-        se_tax = calculate_self_employment_tax(net_profit)
-        
-        other_income = tax_settings['other_income'] or 0
-        total_income_for_tax = net_profit + other_income
-        
-        income_tax, bracket_details = calculate_income_tax(
-            total_income_for_tax, 
-            tax_settings['tax_year'], 
-            tax_settings['filing_status']
-        )
-        
-        additional_medicare_tax = calculate_additional_medicare_tax(
-            total_income_for_tax, 
-            tax_settings['filing_status']
-        )
-        
-        # Get standard deduction info
-        standard_deduction = get_standard_deduction(
-            tax_settings['tax_year'], 
-            tax_settings['filing_status']
-        )
-        
-        total_tax = se_tax + income_tax + additional_medicare_tax
-        
-        return jsonify({
-            'business_income': float(total_income),
-            'business_deductions': float(total_deductions),
-            'net_business_profit': float(net_profit),
-            'other_income': float(other_income),
-            'total_income': float(total_income_for_tax),
-            'standard_deduction': float(standard_deduction),
-            'taxable_income': float(max(0, total_income_for_tax - standard_deduction)),
-            'self_employment_tax': float(se_tax),
-            'income_tax': float(income_tax),
-            'additional_medicare_tax': float(additional_medicare_tax),
-            'total_tax_liability': float(total_tax),
-            'bracket_breakdown': bracket_details,
-            'tax_year': tax_settings['tax_year'],
-            'filing_status': tax_settings['filing_status']
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    """API endpoint for detailed tax breakdown with progressive brackets
+
+    The result only changes on a write, so the rendered body is kept per
+    data version and recomputed only after something has been saved.
+    """
+    etag = data_etag()
+    entry = _BREAKDOWN_CACHE['entry']
+    if entry is None or entry[0] != etag:
+        breakdown = _build_breakdown(get_db())
+        entry = (etag, app.json.dumps(breakdown) if breakdown else None)
+        _BREAKDOWN_CACHE['entry'] = entry
+    
+    if entry[1] is None:
+        return jsonify({'error': 'Tax settings not configured'}), 400
+    return app.response_class(entry[1], mimetype='application/json')
+
+def _build_breakdown(conn):
+    """Compute the detailed tax breakdown, or None without tax settings"""
+    # Get tax settings
+    tax_settings = _get_tax_settings(conn)
+    if not tax_settings:
+        return None
+    
+    # Get financial data and net profit in one round-trip
+    totals = _fetch_totals(conn)
+    total_income = totals['total_income']
+    total_deductions = totals['total_deductions']
+    net_profit = totals['net_profit']
+    
+    # Calculate taxes with detailed breakdown
+    se_tax = calculate_self_employment_tax(net_profit, tax_settings['tax_year'])
+    
+    other_income = tax_settings['other_income'] or 0
+    total_income_for_tax = net_profit + other_income
+    
+    income_tax, bracket_details = calculate_income_tax(
+        total_income_for_tax, 
+        tax_settings['tax_year'], 
+        tax_settings['filing_status']
+    )
+    
+    additional_medicare_tax = calculate_additional_medicare_tax(
+        total_income_for_tax, 
+        tax_settings['filing_status'],
+        tax_settings['tax_year']
+    )
+    
+    # Get standard deduction info
+    standard_deduction = get_standard_deduction(
+        tax_settings['tax_year'], 
+        tax_settings['filing_status']
+    )
+    
+    # Add in whole cents so the total carries no float drift
+    total_tax = to_dollars(sum(map(cents, (se_tax, income_tax, additional_medicare_tax))))
+    
+    # SQLite REAL sums and the tax helpers already yield plain numbers
+    return {
+        'business_income': total_income,
+        'business_deductions': total_deductions,
+        'net_business_profit': net_profit,
+        'other_income': other_income,
+        'total_income': total_income_for_tax,
+        'standard_deduction': standard_deduction,
+        'taxable_income': max(0, total_income_for_tax - standard_deduction),
+        'self_employment_tax': se_tax,
+        'income_tax': income_tax,
+        'additional_medicare_tax': additional_medicare_tax,
+        'total_tax_liability': total_tax,
+        'bracket_breakdown': bracket_details,
+        'tax_year': tax_settings['tax_year'],
+        'filing_status': tax_settings['filing_status']
+    }
+
+# ===== WHAT-IF SIMULATOR ENDPOINT =====
+SIMULATE_MAX_STEPS = 1000
+# Largest |net profit| accepted; keeps cent arithmetic far from float overflow
+SIMULATE_MAX_PROFIT = 1_000_000_000
+
+@app.route('/api/simulate')
+@api
+def api_simulate():
+    """Sweep a range of net profit values and return the taxes owed at each
+
+    Query parameters: net_profit (upper end of the range, required), start
+    (default 0), steps (default 50, at most SIMULATE_MAX_STEPS), tax_year
+    and filing_status (default 2024 / single, and must be a year and status
+    with tax tables). Results are columnar, one array per figure, so the
+    client can chart them directly.
+    """
+    stop, start, steps, tax_year, filing_status = _coerce(request.args, SIMULATE_SCHEMA)
+    if not 2 <= steps <= SIMULATE_MAX_STEPS:
+        return jsonify({'error': f'steps must be between 2 and {SIMULATE_MAX_STEPS}'}), 400
+    # abs() of nan/inf fails the comparison too, so this also rejects them
+    for field, value in (('net_profit', stop), ('start', start)):
+        if not abs(value) <= SIMULATE_MAX_PROFIT:
+            return jsonify({'error': f'{field} must be a number between '
+                                     f'-{SIMULATE_MAX_PROFIT:,} and {SIMULATE_MAX_PROFIT:,}'}), 400
+    if tax_year not in _BANDS or tax_year not in _CONFIG:
+        return jsonify({'error': f'Unsupported tax_year: {tax_year}'}), 400
+    if filing_status not in _BANDS[tax_year]:
+        return jsonify({'error': f'Unsupported filing_status: {filing_status}'}), 400
+    
+    step = (stop - start) / (steps - 1)
+    profits = [start + step * i for i in range(steps)]
+    
+    se_taxes = [calculate_self_employment_tax(profit, tax_year) for profit in profits]
+    # The sweep only needs totals, so skip building per-bracket details
+    income_taxes = [calculate_income_tax(profit, tax_year, filing_status, details=False)[0]
+                    for profit in profits]
+    medicare_taxes = [calculate_additional_medicare_tax(profit, filing_status, tax_year)
+                      for profit in profits]
+    
+    return jsonify({
+        'net_profit': profits,
+        'self_employment_tax': se_taxes,
+        'income_tax': income_taxes,
+        'additional_medicare_tax': medicare_taxes,
+        'total_tax': [to_dollars(sum(map(cents, taxes))) for taxes in zip(se_taxes, income_taxes, medicare_taxes)],
+        'tax_year': tax_year,
+        'filing_status': filing_status
+    })
 
 def open_browser():
-    """Open browser after a short delay"""
-    time.sleep(1.5)
+    """Open the dashboard in the default browser"""
     webbrowser.open('http://localhost:5000')
 
+def _probe_and_open(host='127.0.0.1', port=5000, timeout=10.0):
+    """Open the browser as soon as the server accepts connections
+
+    Polls the port every 10 ms rather than sleeping for a guessed startup
+    time, and gives up quietly if the server never comes up.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            if probe.connect_ex((host, port)) == 0:
+                open_browser()
+                return
+        time.sleep(0.01)
+
 if __name__ == '__main__':
     # Initialize database
-    init_db()
+    ensure_db()
+    threading.Thread(target=_maintenance_loop, daemon=True).start()
     
     print("=" * 60)
     print("🏢 BUSINESS FINANCE MANAGER - PROGRESSIVE TAX EDITION")
     print("=" * 60)
     print("✅ Initializing database...")
-    print("✅ Starting Flask server...")
+    print("✅ Starting " + ("waitress" if waitress is not None else "Flask") + " server...")
     print("🌐 Opening browser at: http://localhost:5000")
     print("❌ Press Ctrl+C to stop the application")
     print("=" * 60)
@@ -1274,12 +2032,22 @@ if __name__ == '__main__':
     print("   • Detailed tax breakdown")
     print("=" * 60)
     
-    # Start browser in separate thread
-    threading.Thread(target=open_browser, daemon=True).start()
+    # Open the browser once the server is listening. Only the __main__
+    # launcher does this, never a WSGI worker importing the module, and not
+    # for headless production runs or a reloader child process.
+    if os.environ.get('FLASK_ENV') != 'production' and not os.environ.get('WERKZEUG_RUN_MAIN'):
+        threading.Thread(target=_probe_and_open, daemon=True).start()
     
     try:
-        # Run Flask app
-        app.run(host='localhost', port=5000, debug=False)
+        if waitress is not None:
+            # Production WSGI server; one thread per pooled connection so a
+            # worker never waits on the pool. Bound to IPv4 loopback, which is
+            # also what the browser probe connects to.
+            waitress.serve(app, host='127.0.0.1', port=5000, threads=SERVER_THREADS,
+                           connection_limit=128)
+        else:
+            # Run Flask app
+            app.run(host='127.0.0.1', port=5000, debug=False, threaded=True)
     except KeyboardInterrupt:
         print("\n👋 Shutting down Business Finance Manager...")
     except Exception as e: